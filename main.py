@@ -8,19 +8,18 @@ Copyright (c) 2025 kaliluying
 MIT License
 """
 
+import heapq
 import logging
-import os
 import sys
 from operator import attrgetter
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from src.client_v2 import NotionGameListV2 as NotionGameList
+from src.config import Config
 from src.errors import ServiceError
-from src.games.steam import SteamGamesLibrary
 from src.logging_config import setup_logging
-from src.utils import echo, soft_exit
+from src.utils import CLEAR_LINE, echo, soft_exit
 
 # 加载 .env 文件
 # 支持打包成exe后的路径：优先使用exe所在目录，否则使用脚本所在目录
@@ -36,97 +35,86 @@ load_dotenv(env_path)
 # 配置日志 (仅文件输出)
 setup_logging(log_file="steam_to_notion.log", level=logging.INFO)
 
-# ----------- 从 .env 文件读取配置 -----------
-# Notion 配置
-NOTION_TOKEN = os.getenv("NOTION_TOKEN")
-NOTION_PAGE_ID = os.getenv("NOTION_PAGE_ID")
-NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID")  # 可选：已有数据库ID
+# 从 .env 文件（环境变量）一次性读取配置
+CFG = Config.from_env()
 
-# Steam 配置（用于验证，实际使用时会从环境变量读取）
-STEAM_TOKEN = os.getenv("STEAM_TOKEN")
-STEAM_USER = os.getenv("STEAM_USER")  # login() 方法会自动处理转换
-
-
-def parse_bool_env(value: str) -> bool:
-    """解析布尔类型环境变量"""
-    return value and value.lower() in ("true", "1", "yes", "on")
-
-
-# 导入选项（布尔值，从字符串转换）
-STORE_BG_COVER = parse_bool_env(os.getenv("STORE_BG_COVER", "false"))
-SKIP_NON_STEAM = parse_bool_env(os.getenv("SKIP_NON_STEAM", "false"))
-USE_ONLY_LIBRARY = parse_bool_env(os.getenv("USE_ONLY_LIBRARY", "false"))
-SKIP_FREE_STEAM = parse_bool_env(os.getenv("SKIP_FREE_STEAM", "false"))
-UPDATE_MODE = parse_bool_env(os.getenv("UPDATE_MODE", "false"))
-
-# 测试限制（可选）
-try:
-    TEST_LIMIT = int(os.getenv("TEST_LIMIT", "0")) or None
-except ValueError:
-    TEST_LIMIT = None
-
-# 调试模式
-DEBUG = parse_bool_env(os.getenv("DEBUG", "false"))
-# ---------------------------------
+# Notion 与 Steam 共用的HTTP会话（配置验证通过后创建）
+session = None
 
 try:
-    # 验证必需的配置
-    required_configs = {
-        "NOTION_TOKEN": NOTION_TOKEN,
-        "STEAM_TOKEN": STEAM_TOKEN,
-        "STEAM_USER": STEAM_USER,
-    }
-    for name, value in required_configs.items():
-        if not value:
-            raise ServiceError(message=f"未配置 {name}，请在 .env 文件中设置")
+    # 验证必需的配置（一次性报告所有缺失项）
+    missing = CFG.missing_required()
+    if missing:
+        raise ServiceError(message=f"未配置 {', '.join(missing)}，请在 .env 文件中设置")
 
     # 验证参数组合的有效性
-    if SKIP_NON_STEAM and USE_ONLY_LIBRARY:
+    if CFG.skip_non_steam and CFG.use_only_library:
         raise ServiceError(
             message="不能同时设置 SKIP_NON_STEAM 和 USE_ONLY_LIBRARY 为 true"
         )
 
-    # 登录Notion
-    echo.y("正在登录Notion...")
-    if not NOTION_DATABASE_ID and not NOTION_PAGE_ID:
+    if not CFG.notion_database_id and not CFG.notion_page_id:
         raise ServiceError(
             message="未配置 NOTION_PAGE_ID 或 NOTION_DATABASE_ID，请在 .env 文件中设置至少一个"
         )
-    ngl = NotionGameList.login()
+
+    # 配置验证通过后再导入客户端模块（requests 等依赖较重，缩短配置错误时的启动时间）
+    from src.client_v2 import NotionGameListV2 as NotionGameList
+    from src.core import create_session
+    from src.games.steam import SteamGamesLibrary
+
+    # Notion 与 Steam 共用的HTTP会话（复用连接池）
+    session = create_session()
+
+    # 登录Notion
+    echo.y("正在登录Notion...")
+    ngl = NotionGameList.login(
+        token=CFG.notion_token,
+        parent_page_id=CFG.notion_page_id,
+        session=session,
+        requests_per_second=CFG.notion_rps,
+        debug=CFG.debug,
+    )
     echo.g("Notion登录成功！")
 
     # 登录Steam
     echo.y("正在登录Steam...")
-    steam = SteamGamesLibrary.login()
+    steam = SteamGamesLibrary.login(
+        api_key=CFG.steam_token, user_id=CFG.steam_user, session=session
+    )
     echo.g("Steam登录成功！")
 
     # 获取Steam游戏库列表
     echo.y("正在获取Steam游戏库...")
-    if TEST_LIMIT:
-        echo.y(f"测试模式：限制获取 {TEST_LIMIT} 个游戏")
+    if CFG.test_limit:
+        echo.y(f"测试模式：限制获取 {CFG.test_limit} 个游戏")
     # 先获取所有游戏ID列表，这会填充缓存
     game_ids = steam.get_games_list(
-        skip_non_steam=SKIP_NON_STEAM,
-        skip_free_games=SKIP_FREE_STEAM,
-        library_only=USE_ONLY_LIBRARY,
-        limit=TEST_LIMIT,
-    )
-    # 从缓存中获取游戏信息
-    game_list = sorted(
-        [steam._games[str(id_)] for id_ in game_ids],
-        key=attrgetter("playtime_minutes"),
-        reverse=True,
+        skip_non_steam=CFG.skip_non_steam,
+        skip_free_games=CFG.skip_free_steam,
+        library_only=CFG.use_only_library,
+        limit=CFG.test_limit,
+        max_workers=CFG.fetch_concurrency,
     )
+    # 从缓存中惰性获取游戏信息，直接交给排序，不构建中间列表
+    # 按游戏时长降序排列；测试模式下只需选出前 TEST_LIMIT 个（缓存中可能多于限制数量）
+    games = steam.iter_games(game_ids)
+    if CFG.test_limit:
+        game_list = heapq.nlargest(
+            CFG.test_limit, games, key=attrgetter("playtime_minutes")
+        )
+    else:
+        game_list = sorted(games, key=attrgetter("playtime_minutes"), reverse=True)
     if not game_list:
         raise ServiceError(message="未找到Steam游戏")
 
-    echo.m(" " * 100 + f"\r已获取 {len(game_list)} 个游戏！")
+    echo.m(f"{CLEAR_LINE}已获取 {len(game_list)} 个游戏！")
 
     # 连接或创建Notion数据库
-    if NOTION_DATABASE_ID:
+    if CFG.notion_database_id:
         # 连接到已有数据库
         echo.y("正在连接到已有Notion数据库...")
-        ngl.connect_database(NOTION_DATABASE_ID)
+        ngl.connect_database(CFG.notion_database_id)
         echo.g("连接成功！")
     else:
         # 创建新数据库
@@ -139,9 +127,9 @@ try:
     errors = ngl.import_game_list(
         game_list,
         None,
-        skip_duplicates=not UPDATE_MODE,
-        update_mode=UPDATE_MODE,
-        use_bg_as_cover=STORE_BG_COVER,
+        skip_duplicates=not CFG.update_mode,
+        update_mode=CFG.update_mode,
+        use_bg_as_cover=CFG.store_bg_cover,
     )
     imported = len(game_list) - len(errors)
 
@@ -151,14 +139,17 @@ try:
     # 显示导入失败的游戏
     if errors:
         echo.r("未导入的游戏: ")
-        for error in sorted(errors, key=lambda x: x.name):
+        for error in sorted(errors, key=attrgetter("name")):
             echo.r(f"- {error.name}")
     echo.g(f"已导入: {imported}/{len(game_list)}")
 
     # 导入成功后删除缓存
     cache_file = Path(steam.CACHE_GAME_FILE)
-    if cache_file.exists():
+    try:
         cache_file.unlink()
+    except FileNotFoundError:
+        pass
+    else:
         echo.g(f"已删除缓存文件: {cache_file}")
 
 except (ServiceError, KeyboardInterrupt, Exception) as err:
@@ -169,9 +160,12 @@ except (ServiceError, KeyboardInterrupt, Exception) as err:
         soft_exit(0)
     else:
         echo(f"\n{err.__class__.__name__}: {err}", file=sys.stderr)
-    if DEBUG:
+    if CFG.debug:
         raise err
     soft_exit(1)
+finally:
+    if session is not None:
+        session.close()
 
 echo.m("完成！")
 soft_exit(0)
@@ -6,6 +6,7 @@ Steam 应用与成就对象封装
 
 __author__ = "SmileyBarry"
 
+import time
 import typing as tp
 
 from .core import APIConnection, SteamObject, store
@@ -27,8 +28,6 @@ class SteamApp(SteamObject):
         """Steam 应用对象，必要时缓存名称。"""
         self._id = appid
         if name is not None:
-            import time
-
             self._cache = dict()
             self._cache["name"] = (name, time.time())
         # 通常，关联的 userid 也是所有者。
@@ -57,16 +56,12 @@ class SteamApp(SteamObject):
         :return: 一个新的 SteamApp 实例
         :rtype: SteamApp
         """
-        if "appid" not in api_json:
+        appid = getattr(api_json, "appid", None)
+        if appid is None:
             # An app ID is a bare minimum.
             raise ValueError("创建SteamApp对象需要一个应用程序ID。")
 
-        appid = api_json.appid
-        name = None
-        if "name" in api_json:
-            name = api_json.name
-
-        return SteamApp(appid, name, associated_userid)
+        return SteamApp(appid, getattr(api_json, "name", None), associated_userid)
 
     @cached_property(ttl=INFINITE)
     def _schema(self) -> tp.Any:
@@ -82,7 +77,19 @@ class SteamApp(SteamObject):
     @cached_property(ttl=INFINITE)
     def achievements(self) -> tp.List["SteamAchievement"]:
         """获取成就列表并填充全局百分比与用户解锁状态。"""
-        global_percentages = APIConnection().call(
+        achievements_list = []
+        # 先检查 Schema（已缓存），没有成就的应用无需再请求百分比与用户数据
+        game_stats = getattr(self._schema.game, "availableGameStats", None)
+        if game_stats is None:
+            # No stat data -- at all. This is a hidden app.
+            return achievements_list
+        schema_achievements = getattr(game_stats, "achievements", None)
+        if not schema_achievements:
+            # 只有统计数据，没有成就
+            return achievements_list
+
+        connection = APIConnection()
+        global_percentages = connection.call(
             "ISteamUserStats",
             "GetGlobalAchievementPercentagesForApp",
             "v0002",
@@ -91,58 +98,69 @@ class SteamApp(SteamObject):
         if self._userid is not None:
             # Ah-ha, this game is associated to a user!
             userid = self._userid
-            unlocks = APIConnection().call(
+            user_stats = connection.call(
                 "ISteamUserStats",
                 "GetUserStatsForGame",
                 "v2",
                 appid=self._id,
                 steamid=userid,
             )
-            if "achievements" in unlocks.playerstats:
-                unlocks = [
-                    associated_achievement.name
-                    for associated_achievement in unlocks.playerstats.achievements
-                    if associated_achievement.achieved != 0
-                ]
+            # 没有解锁任何成就时响应中不含 achievements 字段
+            unlocks = frozenset(
+                associated_achievement.name
+                for associated_achievement in getattr(
+                    user_stats.playerstats, "achievements", ()
+                )
+                if associated_achievement.achieved != 0
+            )
         else:
             userid = None
             unlocks = None
-        achievements_list = []
-        schema = tp.cast(tp.Any, self._schema)
-        if "availableGameStats" not in schema.game:
-            # No stat data -- at all. This is a hidden app.
-            return achievements_list
-        for achievement in schema.game.availableGameStats.achievements:
+        # 先按成就名建立百分比索引，避免对每个成就线性扫描全局百分比列表
+        percent_by_name = {
+            global_achievement.name: float(global_achievement.percent)
+            for global_achievement in (
+                global_percentages.achievementpercentages.achievements
+            )
+        }
+        for achievement in schema_achievements:
             achievement_obj = SteamAchievement(
-                self._id, achievement.name, achievement.displayName, userid
+                self._id,
+                achievement.name,
+                achievement.displayName,
+                userid,
+                achievement.hidden != 0,
             )
-            achievement_obj._cache = {}
-            if achievement.hidden == 0:
-                store(achievement_obj, "is_hidden", False)
-            else:
-                store(achievement_obj, "is_hidden", True)
-            for (
-                global_achievement
-            ) in global_percentages.achievementpercentages.achievements:
-                if global_achievement.name == achievement.name:
-                    achievement_obj.unlock_percentage = global_achievement.percent
-            achievements_list += [achievement_obj]
-        if unlocks is not None:
-            for achievement in achievements_list:
-                if achievement.apiname in unlocks:
-                    store(achievement, "is_achieved", True)
-                else:
-                    store(achievement, "is_achieved", False)
+            achievement_obj.unlock_percentage = percent_by_name.get(
+                achievement.name, 0.0
+            )
+            if unlocks is not None:
+                store(achievement_obj, "is_unlocked", achievement.name in unlocks)
+            achievements_list.append(achievement_obj)
         return achievements_list
 
+    @cached_property(ttl=INFINITE)
+    def _achievements_by_apiname(self) -> tp.Dict[str, "SteamAchievement"]:
+        """成就 API 名称到成就对象的索引。"""
+        return {achievement.apiname: achievement for achievement in self.achievements}
+
+    def achievement(self, apiname: str) -> "SteamAchievement":
+        """
+        按 API 名称获取单个成就。
+
+        :param apiname: 成就的 API 名称。
+        :type apiname: str
+        :return: 对应的成就对象
+        :rtype: SteamAchievement
+        :raises KeyError: 该应用没有此成就
+        """
+        return self._achievements_by_apiname[apiname]
+
     @cached_property(ttl=INFINITE)
     def name(self):
         """游戏名称（来自 Schema）。"""
-        schema = tp.cast(tp.Any, self._schema)
-        if "gameName" in schema.game:
-            return schema.game.gameName
-        else:
-            return "<Unknown>"
+        schema = self._schema
+        return getattr(schema.game, "gameName", "<Unknown>")
 
     @cached_property(ttl=INFINITE)
     def owner(self):
@@ -168,6 +186,7 @@ class SteamAchievement(SteamObject):
         apiname: str,
         displayname: str,
         linked_userid: tp.Optional[int] = None,
+        hidden: tp.Optional[bool] = None,
     ):
         """
         成就对象：包含显示名、API 名称、关联用户等信息。
@@ -183,12 +202,16 @@ class SteamAchievement(SteamObject):
         :type displayname: str
         :param linked_userid: 此成就关联的用户 ID。
         :type linked_userid: int
+        :param hidden: 成就是否隐藏（来自应用的 Schema）。
+        :type hidden: bool
         :return: 一个新的 SteamAchievement 实例。
         """
         self._appid = linked_appid
         self._id = apiname
         self._displayname = displayname
         self._userid = linked_userid
+        if hidden is not None:
+            store(self, "is_hidden", hidden)
         self.unlock_percentage = 0.0
 
     def __hash__(self):
@@ -210,16 +233,14 @@ class SteamAchievement(SteamObject):
 
     @cached_property(ttl=INFINITE)
     def is_hidden(self) -> tp.Optional[bool]:
-        """成就是否隐藏（从 Schema 查询）。"""
-        response = APIConnection().call(
-            "ISteamUserStats", "GetSchemaForGame", "v2", appid=self._appid
-        )
-        for achievement in response.game.availableGameStats.achievements:
+        """成就是否隐藏（创建时未提供则从应用的 Schema 查询，找不到时为 None）。"""
+        schema = SteamApp(self._appid)._schema
+        game_stats = getattr(schema.game, "availableGameStats", None)
+        for achievement in getattr(game_stats, "achievements", ()):
             if achievement.name == self._id:
-                if achievement.hidden == 0:
-                    return False
-                else:
-                    return True
+                return achievement.hidden != 0
+        # Cannot be found.
+        return None
 
     @cached_property(ttl=INFINITE)
     def is_unlocked(self) -> bool:
@@ -236,9 +257,6 @@ class SteamAchievement(SteamObject):
         )
         for achievement in response.playerstats.achievements:
             if achievement.apiname == self._id:
-                if achievement.achieved == 1:
-                    return True
-                else:
-                    return False
+                return achievement.achieved == 1
         # Cannot be found.
         return False
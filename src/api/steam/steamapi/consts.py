@@ -7,16 +7,43 @@
 __author__ = "SmileyBarry"
 
 
-class Enum(object):
+class EnumMeta(type):
     """
-    枚举基类。
+    枚举元类。
 
-    禁止实例化，只能使用其属性。
+    在类级别禁止实例化，并为每个枚举建立值到名称的反查表。
     """
 
-    def __init__(self):
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._by_value = {
+            value: key
+            for key, value in namespace.items()
+            if not key.startswith("_") and isinstance(value, int)
+        }
+
+    def __call__(cls, *args, **kwargs):
         raise TypeError("Enums cannot be instantiated, use their attributes instead")
 
+    def name_of(cls, value):
+        """
+        按值反查枚举成员名称。
+
+        :param value: 枚举值（例如 API 返回的整数）。
+        :type value: int
+        :return: 成员名称，未知值返回 None。
+        :rtype: str or None
+        """
+        return cls._by_value.get(value)
+
+
+class Enum(metaclass=EnumMeta):
+    """
+    枚举基类。
+
+    禁止实例化，只能使用其属性。
+    """
+
 
 class CommunityVisibilityState(Enum):
     """
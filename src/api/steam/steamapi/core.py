@@ -6,10 +6,18 @@ Steam Web API 核心封装
 
 __author__ = "SmileyBarry"
 
+import functools
+import threading
 import typing as tp
 
 import requests
 import time
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选加速依赖
+    orjson = None
 
 from .consts import (
     API_CALL_DOCSTRING_TEMPLATE,
@@ -42,6 +50,51 @@ APITypes: tp.Dict[str, tp.Any] = {
 }
 
 
+def _parse_json(response: requests.Response) -> tp.Any:
+    """
+    解析 JSON 响应体。
+
+    安装了 orjson 时直接解析原始字节，省去 bytes -> str 的解码与标准库
+    json 的解析开销；否则回退到 ``response.json()``。
+
+    :param response: HTTP 响应对象
+    :rtype: 解析后的 JSON 对象
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+# 所有 API 调用共享的 HTTP 会话（首次使用时创建），复用 TCP/TLS 连接
+_session: tp.Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    获取共享的 HTTP 会话。
+
+    所有请求都发往同一个 API 域名，因此使用单个连接池并保持长连接，
+    避免每次调用都重新进行 TCP/TLS 握手。线程安全。
+
+    响应压缩：requests 默认发送 ``Accept-Encoding: gzip, deflate``
+    （安装 brotli 后自动加入 br），由 urllib3 在读取时解压。
+
+    :return: 共享的 requests 会话。
+    :rtype: requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
 class APICall(object):
     def __init__(self, api_id: str, parent: tp.Any, method: tp.Optional[str] = None):
         """
@@ -237,9 +290,9 @@ class APICall(object):
             method = self._method
 
         if method == POST:
-            response = requests.request(method, query, data=kwargs)
+            response = get_session().request(method, query, data=kwargs)
         else:
-            response = requests.request(method, query, params=kwargs)
+            response = get_session().request(method, query, params=kwargs)
 
         errors.check(response)
 
@@ -248,14 +301,14 @@ class APICall(object):
             self._parent._register(self)
 
         if automatic_parsing is True:
-            response_obj = response.json()
+            response_obj = _parse_json(response)
             if len(response_obj.keys()) == 1 and "response" in response_obj:
                 return APIResponse(response_obj["response"])
             else:
                 return APIResponse(response_obj)
         else:
             if kwargs["format"] == "json":
-                return response.json()
+                return _parse_json(response)
             else:
                 return response.content
 
@@ -508,6 +561,18 @@ class APIConnection(object):
         """重置连接器使用的 API Key。"""
         self._api_key = api_key
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _query_url(cls, interface: str, command: str, version: str) -> str:
+        """
+        构建（并缓存）接口/命令/版本对应的请求 URL。
+
+        :rtype: str
+        """
+        return cls.QUERY_TEMPLATE.format(
+            interface=interface, command=command, version=version
+        )
+
     def call(
         self,
         interface: str,
@@ -552,19 +617,17 @@ class APIConnection(object):
         if self._api_key is not None:
             kwargs["key"] = self._api_key
 
-        query = self.QUERY_TEMPLATE.format(
-            interface=interface, command=command, version=version
-        )
+        query = self._query_url(interface, command, version)
 
         if method == POST:
-            response = requests.request(method, query, data=kwargs)
+            response = get_session().request(method, query, data=kwargs)
         else:
-            response = requests.request(method, query, params=kwargs)
+            response = get_session().request(method, query, params=kwargs)
 
         errors.check(response)
 
         if automatic_parsing is True:
-            response_obj = response.json()
+            response_obj = _parse_json(response)
             if len(response_obj.keys()) == 1 and "response" in response_obj:
                 return APIResponse(response_obj["response"])
             else:
@@ -583,16 +646,18 @@ class APIResponse(object):
     """
 
     def __init__(self, father_dict: tp.Dict[str, tp.Any]):
-        # Initialize an empty dictionary.
-        self._real_dictionary = {}
         # Recursively wrap the response in APIResponse instances.
-        for item in father_dict:
-            if isinstance(father_dict[item], dict):
-                self._real_dictionary[item] = APIResponse(father_dict[item])
-            elif isinstance(father_dict[item], list):
-                self._real_dictionary[item] = APIResponse._wrap_list(father_dict[item])
+        # 单次遍历 items()，每个值只取一次并按类型分派
+        real_dictionary = {}
+        for key, value in father_dict.items():
+            value_type = type(value)
+            if value_type is dict:
+                real_dictionary[key] = APIResponse(value)
+            elif value_type is list:
+                real_dictionary[key] = APIResponse._wrap_list(value)
             else:
-                self._real_dictionary[item] = father_dict[item]
+                real_dictionary[key] = value
+        self._real_dictionary = real_dictionary
 
     @staticmethod
     def _wrap_list(original_list: tp.List[tp.Any]) -> tp.List[tp.Any]:
@@ -608,13 +673,15 @@ class APIResponse(object):
         :rtype: list
         """
         new_list = []
+        append = new_list.append
         for item in original_list:
-            if isinstance(item, dict):
-                new_list += [APIResponse(item)]
-            elif isinstance(item, list):
-                new_list += [APIResponse._wrap_list(item)]
+            item_type = type(item)
+            if item_type is dict:
+                append(APIResponse(item))
+            elif item_type is list:
+                append(APIResponse._wrap_list(item))
             else:
-                new_list += [item]
+                append(item)
         return new_list
 
     def __repr__(self):
@@ -650,7 +717,9 @@ class SteamObject(object):
     """
 
     _id: tp.Any = None
-    _cache: tp.Dict[str, tp.Any] = {}
+    # 属性缓存按实例在首次使用时创建（见 cached_property 与 store），
+    # 不能在类上给默认值，否则所有实例会共享同一个字典
+    _cache: tp.Dict[str, tp.Any]
     name: tp.Any = None
 
     @property
@@ -712,6 +781,8 @@ def store(
         received_time = time.time()
     # Just making sure caching is supported for this object...
     if issubclass(type(obj), SteamObject) or hasattr(obj, "_cache"):
+        if not hasattr(obj, "_cache"):
+            obj._cache = {}
         obj._cache[property_name] = (data, received_time)
     else:
         raise TypeError(
@@ -731,6 +802,8 @@ def expire(obj: tp.Any, property_name: str) -> None:
     :type property_name:
     """
     if issubclass(type(obj), SteamObject) or hasattr(obj, "_cache"):
+        if not hasattr(obj, "_cache"):
+            obj._cache = {}
         del obj._cache[property_name]
     else:
         raise TypeError(
@@ -70,22 +70,21 @@ class cached_property(object):
         return self
 
     def __get__(self, inst, owner):
-        now = time.time()
-        value, last_update = None, None
-        if not hasattr(inst, "_cache"):
-            inst._cache = {}
+        try:
+            cache = inst._cache
+        except AttributeError:
+            cache = inst._cache = {}
 
-        entry = inst._cache.get(self.__name__, None)
+        entry = cache.get(self.__name__, None)
         if entry is not None:
             value, last_update = entry
-            if now - last_update > self.ttl > 0:
-                entry = None
-
-        if entry is None:
-            value = self.fget(inst)
-            cache = inst._cache
-            cache[self.__name__] = (value, now)
+            # ttl=0 永不过期：命中时直接返回，无需读取时钟
+            if self.ttl <= 0 or time.time() - last_update <= self.ttl:
+                return value
 
+        now = time.time()
+        value = self.fget(inst)
+        inst._cache[self.__name__] = (value, now)
         return value
 
 
@@ -120,6 +119,11 @@ class Singleton:
         在所有后续调用中，返回已创建的实例。
 
         """
+        # 实例创建后直接返回，无需每次获取锁
+        try:
+            return self._instance
+        except AttributeError:
+            pass
         with self._lock:
             try:
                 return self._instance
@@ -4,7 +4,10 @@ Notion游戏列表客户端 (v2)
 用于与Notion API交互，创建和管理游戏列表
 """
 
+import functools
+import re
 import typing as tp
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 import time
 import os
@@ -14,10 +17,72 @@ import requests
 
 import dateparser
 
+from src.config import DEFAULT_NOTION_RPS
+from src.core import create_session
 from src.errors import ServiceError, NotionApiError, DataParseError
 from src.games.base import GameInfo
 
-from src.utils import echo, color
+from src.utils import echo, color, json_loads, json_dumps, parse_bool_env, RateLimiter
+
+# Steam 商店常见的英文日期形态（逗号已替换为空格）：
+# 12 Feb 2022 / Feb 12 2022 / 12 February 2022 / February 12 2022 / 2022-02-12 / Feb 2022
+DATE_SHAPE_RE = re.compile(
+    r"^(?:(?P<iso>\d{4}-\d{1,2}-\d{1,2})"
+    r"|\d{1,2} (?P<dmy>[A-Za-z]+) \d{4}"
+    r"|(?P<mdy>[A-Za-z]+) \d{1,2} \d{4}"
+    r"|(?P<my>[A-Za-z]+) \d{4})$"
+)
+# (日期形态, 月份是否为缩写) -> strptime 格式，导入时一次性生成
+DATE_SHAPE_FORMATS = {
+    (shape, abbreviated): template.format("%b" if abbreviated else "%B")
+    for shape, template in (
+        ("iso", "%Y-%m-%d"),
+        ("dmy", "%d {} %Y"),
+        ("mdy", "{} %d %Y"),
+        ("my", "{} %Y"),
+    )
+    for abbreviated in (True, False)
+}
+
+# dateparser 解析设置
+DATEPARSER_SETTINGS = {
+    "PREFER_DAY_OF_MONTH": "first",  # 如果只有年月，使用月初
+    "PREFER_DATES_FROM": "past",  # 偏好过去的日期（适合游戏发布日期）
+    "RELATIVE_BASE": datetime.now(),  # 相对日期的基准
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_string(date_str: str) -> tp.Optional[str]:
+    """
+    将发布日期字符串解析为 YYYY-MM-DD（结果按字符串缓存，许多游戏共享相同的发布日期）
+
+    Args:
+        date_str: 发布日期字符串
+
+    Returns:
+        str: 日期字符串 (YYYY-MM-DD) 或 None
+    """
+    if date_str.isascii():
+        # 先用正则判断日期形态，只调用一次 strptime
+        cleaned = " ".join(date_str.replace(",", " ").split())
+        match = DATE_SHAPE_RE.match(cleaned)
+        if match:
+            shape = match.lastgroup
+            month = match.group(shape)
+            fmt = DATE_SHAPE_FORMATS[shape, len(month) == 3]
+            try:
+                return datetime.strptime(cleaned, fmt).strftime("%Y-%m-%d")
+            except ValueError:
+                pass
+
+    # dateparser 支持 200+ 种语言，自动识别语言和格式
+    parsed_date = dateparser.parse(
+        date_str,
+        languages=None,  # 自动检测语言（支持 200+ 种语言）
+        settings=DATEPARSER_SETTINGS,
+    )
+    return parsed_date.strftime("%Y-%m-%d") if parsed_date else None
 
 
 class NotionGameListV2:
@@ -35,22 +100,64 @@ class NotionGameListV2:
     NOTION_VERSION = "2025-09-03"
     # API 基础URL
     API_BASE_URL = "https://api.notion.com/v1"
-
-    def __init__(self, token: str, parent_page_id: tp.Optional[str] = None):
+    # 默认每秒请求数（与 Config 保持一致）
+    DEFAULT_RPS = DEFAULT_NOTION_RPS
+    # 限速器令牌桶容量（允许的突发请求数）
+    RATE_LIMIT_BURST = 3
+    # 批量导入时的默认并发请求数
+    DEFAULT_IMPORT_WORKERS = 3
+    # 批量导入时每批提交的新游戏数
+    IMPORT_BATCH_SIZE = 25
+    # 导入进度行的最小刷新间隔（秒）
+    PROGRESS_INTERVAL = 0.1
+    # 已有游戏映射缓存的有效期（秒）
+    EXISTING_CACHE_TTL = 60
+    # 常见平台的多选选项（所有游戏共享，只读）
+    PLATFORM_OPTIONS = {
+        name: {"name": name}
+        for name in ("steam", "Steam", "PC", "Switch", "PlayStation", "Xbox")
+    }
+
+    def __init__(
+        self,
+        token: str,
+        parent_page_id: tp.Optional[str] = None,
+        session: tp.Optional[requests.Session] = None,
+        requests_per_second: tp.Optional[float] = None,
+        debug: bool = False,
+    ):
         """
         初始化Notion客户端
 
         Args:
             token: Notion API token (Integration token)
             parent_page_id: 父页面ID（可选，用于创建新数据库）
+            session: 共享的HTTP会话（可选，未提供时自行创建）
+            requests_per_second: 每秒最大请求数（可选，默认 DEFAULT_RPS）
+            debug: 是否输出调试信息
         """
         self.token = token
+        self.debug = debug
         self.parent_page_id = parent_page_id
         self._gl_icon = "👾"  # 游戏列表图标
         self._database_id = None
-        self._db_properties_cache = None  # 缓存数据库属性
+        self._page_parent = None  # 新建页面时共用的 parent 字段（只读，按引用共享）
+        self._db_properties_cache = None  # 缓存数据库属性（同时计算下列派生字段）
         self._is_new_database = False  # 标记数据库是否为新建的
         self._data_source_id = None  # 数据源ID（用于新API版本）
+        self._existing_map_cache = None  # 已有游戏名称到页面ID的映射缓存
+        self._existing_map_cache_key = None  # 缓存对应的数据库ID
+        self._existing_map_cache_time = 0.0  # 缓存写入时间（monotonic）
+        self._owns_session = session is None  # 是否由本对象负责关闭会话
+        self._session = session if session is not None else create_session()
+        self._rate_limiter = RateLimiter(
+            (
+                requests_per_second
+                if requests_per_second is not None
+                else self.DEFAULT_RPS
+            ),
+            capacity=self.RATE_LIMIT_BURST,
+        )
         self._headers = {
             "Authorization": f"Bearer {token}",
             "Notion-Version": self.NOTION_VERSION,
@@ -59,7 +166,12 @@ class NotionGameListV2:
 
     @classmethod
     def login(
-        cls, token: tp.Optional[str] = None, parent_page_id: tp.Optional[str] = None
+        cls,
+        token: tp.Optional[str] = None,
+        parent_page_id: tp.Optional[str] = None,
+        session: tp.Optional[requests.Session] = None,
+        requests_per_second: tp.Optional[float] = None,
+        debug: tp.Optional[bool] = None,
     ):
         """
         登录Notion
@@ -67,6 +179,9 @@ class NotionGameListV2:
         Args:
             token: Notion API token，如果为None则从环境变量或提示用户输入
             parent_page_id: 父页面ID（可选）
+            session: 共享的HTTP会话（可选）
+            requests_per_second: 每秒最大请求数（由 Config.notion_rps 传入，为None时使用 DEFAULT_RPS）
+            debug: 是否输出调试信息，如果为None则从环境变量 DEBUG 读取
 
         Returns:
             NotionGameListV2实例
@@ -81,18 +196,39 @@ class NotionGameListV2:
         if parent_page_id is None:
             parent_page_id = os.getenv("NOTION_PAGE_ID")
 
-        return cls(token=token, parent_page_id=parent_page_id)
+        if debug is None:
+            debug = parse_bool_env(os.getenv("DEBUG", "false"))
+
+        return cls(
+            token=token,
+            parent_page_id=parent_page_id,
+            session=session,
+            requests_per_second=requests_per_second,
+            debug=debug,
+        )
+
+    def __enter__(self):
+        """支持上下文管理器"""
+        return self
 
-    def _make_request(
-        self, method: str, endpoint: str, max_retries: int = 3, **kwargs
-    ) -> requests.Response:
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """退出时关闭自行创建的session"""
+        self.close()
+
+    def close(self):
+        """关闭自行创建的HTTP会话（共享会话由创建方负责关闭）"""
+        if self._owns_session:
+            self._session.close()
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
-        发送HTTP请求，带重试机制
+        发送HTTP请求
+        429/5xx 与连接错误由会话的传输层（urllib3 Retry）按指数退避自动重试，
+        并遵守 Retry-After 响应头，这里只负责限速和错误转换
 
         Args:
             method: HTTP方法 (GET, POST, PATCH等)
             endpoint: API端点（相对于API_BASE_URL）
-            max_retries: 最大重试次数
             **kwargs: 传递给requests的参数
 
         Returns:
@@ -102,107 +238,65 @@ class NotionGameListV2:
             NotionApiError: API请求失败
         """
         url = f"{self.API_BASE_URL}/{endpoint.lstrip('/')}"
-        retry_delay = 1
+        # 请求体预先序列化一次（传输层重试时复用）
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps(kwargs.pop("json"))
 
-        for attempt in range(max_retries):
-            try:
-                response = requests.request(
-                    method, url, headers=self._headers, **kwargs
-                )
+        try:
+            self._rate_limiter.acquire()
+            response = self._session.request(
+                method, url, headers=self._headers, **kwargs
+            )
+        except requests.exceptions.Timeout as e:
+            raise NotionApiError(
+                message=f"Notion API 请求超时",
+                code=408,
+                details={"url": url, "method": method},
+                original_exception=e,
+            ) from e
+        except requests.exceptions.ConnectionError as e:
+            raise NotionApiError(
+                message=f"Notion API 连接失败",
+                code=503,
+                details={"url": url, "method": method},
+                original_exception=e,
+            ) from e
+        except requests.exceptions.RequestException as e:
+            raise NotionApiError(
+                message=f"Notion API 请求失败: {e}",
+                code=503,
+                details={"url": url, "method": method},
+                original_exception=e,
+            ) from e
 
-                # 处理速率限制
-                if response.status_code == 429:
-                    retry_after_header = response.headers.get("Retry-After")
-                    try:
-                        retry_after = (
-                            int(retry_after_header)
-                            if retry_after_header
-                            else retry_delay
-                        )
-                    except ValueError:
-                        retry_after = retry_delay
-                    if attempt < max_retries - 1:
-                        echo.y(
-                            f"速率限制，等待 {retry_after} 秒后重试 ({attempt + 1}/{max_retries})..."
-                        )
-                        time.sleep(retry_after)
-                        continue
-                    else:
-                        raise NotionApiError(
-                            message=f"Notion API 速率限制，已达最大重试次数",
-                            code=429,
-                            details={"url": url, "method": method},
-                        )
+        # 传输层重试耗尽后仍被限速：暂停限速器，让其他并发请求一起等待
+        if response.status_code == 429:
+            try:
+                retry_after = int(response.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1
+            self._rate_limiter.pause(retry_after)
+            raise NotionApiError(
+                message=f"Notion API 速率限制，已达最大重试次数",
+                code=429,
+                details={"url": url, "method": method},
+            )
 
-                # 处理其他错误
-                if response.status_code >= 400:
-                    try:
-                        error_data = response.json() if response.content else {}
-                    except Exception:
-                        error_data = {
-                            "message": f"HTTP {response.status_code}, 响应解析失败"
-                        }
-                    error_msg = error_data.get(
-                        "message", f"HTTP {response.status_code}"
-                    )
-                    raise NotionApiError(
-                        message=f"Notion API错误: {error_msg}",
-                        code=response.status_code,
-                        details={"url": url, "method": method},
-                        original_exception=None,
-                    )
+        # 处理其他错误
+        if response.status_code >= 400:
+            try:
+                error_data = json_loads(response.content) if response.content else {}
+            except Exception:
+                error_data = {"message": f"HTTP {response.status_code}, 响应解析失败"}
+            error_msg = error_data.get("message", f"HTTP {response.status_code}")
+            raise NotionApiError(
+                message=f"Notion API错误: {error_msg}",
+                code=response.status_code,
+                details={"url": url, "method": method},
+                original_exception=None,
+            )
 
-                return response
-
-            except requests.exceptions.Timeout as e:
-                if attempt < max_retries - 1:
-                    echo.y(
-                        f"请求超时，{retry_delay}秒后重试 ({attempt + 1}/{max_retries}): {e}"
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                raise NotionApiError(
-                    message=f"Notion API 请求超时",
-                    code=408,
-                    details={"url": url, "method": method},
-                    original_exception=e,
-                ) from e
-            except requests.exceptions.ConnectionError as e:
-                if attempt < max_retries - 1:
-                    echo.y(
-                        f"连接失败，{retry_delay}秒后重试 ({attempt + 1}/{max_retries}): {e}"
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                raise NotionApiError(
-                    message=f"Notion API 连接失败",
-                    code=503,
-                    details={"url": url, "method": method},
-                    original_exception=e,
-                ) from e
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    echo.y(
-                        f"请求失败，{retry_delay}秒后重试 ({attempt + 1}/{max_retries}): {e}"
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                raise NotionApiError(
-                    message=f"Notion API 请求失败: {e}",
-                    code=503,
-                    details={"url": url, "method": method},
-                    original_exception=e,
-                ) from e
-            except Exception as e:
-                raise NotionApiError(
-                    message=f"Notion API 请求失败: {e}",
-                    code=500,
-                    details={"url": url, "method": method},
-                    original_exception=e,
-                ) from e
+        return response
 
     def create_game_page(
         self, title: str = "Steam Game Library", description: str = "My game list"
@@ -245,8 +339,9 @@ class NotionGameListV2:
                 },
             )
 
-            database_data = database_response.json()
+            database_data = json_loads(database_response.content)
             self._database_id = database_data["id"]
+            self._page_parent = {"database_id": self._database_id}
             self._is_new_database = True  # 标记为新创建的数据库
 
             # 缓存数据库属性
@@ -274,7 +369,7 @@ class NotionGameListV2:
                 db_get_response = self._make_request(
                     "GET", f"/databases/{self._database_id}"
                 )
-                db_get_data = db_get_response.json()
+                db_get_data = json_loads(db_get_response.content)
                 self._db_properties_cache = db_get_data.get("properties", {})
                 # 重新获取时也检查 data_sources
                 if "data_sources" in db_get_data:
@@ -282,15 +377,14 @@ class NotionGameListV2:
                     if data_sources:
                         self._data_source_id = data_sources[0].get("id")
 
-            if self._db_properties_cache:
-                echo.c(f"数据库属性: {', '.join(self._db_properties_cache.keys())}")
-            else:
+            if not self._db_properties_cache:
                 echo.r("错误：数据库属性仍然为空！")
                 raise NotionApiError(
                     message="数据库创建成功但属性为空，请检查 API 版本和属性定义",
                     code=500,
                     details={"database_id": self._database_id},
                 )
+            self._validate_schema(database_data)
 
             # 返回兼容旧接口的字典
             return {"id": self._database_id, "collection": {"id": self._database_id}}
@@ -305,6 +399,43 @@ class NotionGameListV2:
                 original_exception=e,
             ) from e
 
+    @property
+    def _db_properties_cache(self) -> tp.Optional[dict]:
+        """数据库属性缓存"""
+        return self._db_properties
+
+    @_db_properties_cache.setter
+    def _db_properties_cache(self, value: tp.Optional[dict]):
+        """
+        设置数据库属性缓存，并预先计算标题属性名称和可选属性是否存在，
+        避免每个游戏都重新扫描属性字典
+        """
+        self._db_properties = value
+        props = value or {}
+        self._title_prop_name = self._get_title_property_name(props)
+        # 请求体中使用属性ID作为键（ASCII，比中文属性名更短）；不存在的属性为 None
+        self._title_key = self._property_key(props, self._title_prop_name)
+        self._platform_key = self._property_key(props, "平台")
+        self._playtime_key = self._property_key(props, "游戏时长(小时)")
+        self._release_key = self._property_key(props, "发行日期")
+        self._note_key = self._property_key(props, "备注")
+
+    @staticmethod
+    def _property_key(props: dict, name: tp.Optional[str]) -> tp.Optional[str]:
+        """
+        获取属性在请求体中使用的键（优先使用属性ID，缺少ID时使用属性名）
+
+        Args:
+            props: 数据库属性字典
+            name: 属性名称
+
+        Returns:
+            str: 属性ID或名称，属性不存在时返回 None
+        """
+        if not name or name not in props:
+            return None
+        return props[name].get("id") or name
+
     def _get_title_property_name(self, db_properties: dict) -> tp.Optional[str]:
         """
         从数据库属性中查找标题属性名称
@@ -329,18 +460,19 @@ class NotionGameListV2:
         """
         if self._db_properties_cache is None:
             db_response = self._make_request("GET", f"/databases/{self._database_id}")
-            self._db_properties_cache = db_response.json().get("properties", {})
+            self._db_properties_cache = json_loads(db_response.content).get(
+                "properties", {}
+            )
         return self._db_properties_cache
 
     def _build_game_properties(
-        self, game: GameInfo, db_properties: dict, include_title: bool = False
+        self, game: GameInfo, include_title: bool = False
     ) -> dict:
         """
-        构建游戏属性字典
+        构建游戏属性字典（根据已缓存的数据库属性决定包含哪些字段）
 
         Args:
             game: 游戏信息对象
-            db_properties: 数据库属性字典
             include_title: 是否包含标题属性
 
         Returns:
@@ -348,42 +480,35 @@ class NotionGameListV2:
         """
         properties = {}
 
-        if include_title:
-            title_prop_name = self._get_title_property_name(db_properties)
-            if title_prop_name:
-                properties[title_prop_name] = {
-                    "type": "title",
-                    "title": [{"type": "text", "text": {"content": game.name}}],
-                }
+        # 属性类型可由值的结构推断，省略 "type" 字段以减小请求体
+        if include_title and self._title_key:
+            properties[self._title_key] = {
+                "title": [{"text": {"content": game.name}}],
+            }
 
-        if "平台" in db_properties:
-            properties["平台"] = {
-                "type": "multi_select",
-                "multi_select": [{"name": platform} for platform in game.platforms],
+        if self._platform_key:
+            properties[self._platform_key] = {
+                "multi_select": [
+                    self.PLATFORM_OPTIONS.get(platform) or {"name": platform}
+                    for platform in game.platforms
+                ],
             }
 
-        if "游戏时长(小时)" in db_properties:
+        if self._playtime_key:
             playtime_hours = (
                 round(game.playtime_minutes / 60, 2) if game.playtime_minutes else 0
             )
-            properties["游戏时长(小时)"] = {"type": "number", "number": playtime_hours}
+            properties[self._playtime_key] = {"number": playtime_hours}
 
-        if "发行日期" in db_properties:
+        if self._release_key:
             release_date = self._parse_date(game)
             if release_date:
-                properties["发行日期"] = {
-                    "type": "date",
-                    "date": {"start": release_date},
-                }
+                properties[self._release_key] = {"date": {"start": release_date}}
 
-        if "备注" in db_properties and game.playtime:
-            properties["备注"] = {
-                "type": "rich_text",
+        if self._note_key and game.playtime:
+            properties[self._note_key] = {
                 "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {"content": f"游戏时长(小时): {game.playtime}"},
-                    }
+                    {"text": {"content": f"游戏时长(小时): {game.playtime}"}}
                 ],
             }
 
@@ -412,6 +537,30 @@ class NotionGameListV2:
 
         return payload
 
+    def _build_page_payload(
+        self, game: GameInfo, use_bg_as_cover: bool, include_title: bool
+    ) -> dict:
+        """
+        构建创建/更新页面的完整请求体（不含 parent）
+        纯数据构建，不发起任何请求，依赖的架构信息均已在缓存属性时预先计算
+
+        Args:
+            game: 游戏信息对象
+            use_bg_as_cover: 是否使用背景图作为封面
+            include_title: 是否包含标题属性
+
+        Returns:
+            dict: 包含 properties、icon 和 cover 的请求体
+        """
+        payload = {}
+
+        properties = self._build_game_properties(game, include_title=include_title)
+        if properties:
+            payload["properties"] = properties
+
+        payload.update(self._build_cover_payload(game, use_bg_as_cover))
+        return payload
+
     def _fetch_properties_from_data_source(self, data_sources: tp.List[dict]) -> dict:
         """
         从 data_sources 获取属性（新版 API）
@@ -430,7 +579,7 @@ class NotionGameListV2:
         self._data_source_id = data_source_id
         try:
             ds_response = self._make_request("GET", f"/data_sources/{data_source_id}")
-            return ds_response.json().get("properties", {})
+            return json_loads(ds_response.content).get("properties", {})
         except Exception as e:
             echo.y(f"从 data_source 获取属性失败: {e}")
             return {}
@@ -443,10 +592,11 @@ class NotionGameListV2:
             database_id: 数据库ID
         """
         self._database_id = database_id
+        self._page_parent = {"database_id": database_id}
         self._is_new_database = False  # 标记为已存在的数据库
         # 获取并缓存数据库属性
         db_response = self._make_request("GET", f"/databases/{database_id}")
-        db_data = db_response.json()
+        db_data = json_loads(db_response.content)
         self._db_properties_cache = db_data.get("properties", {})
         echo.g(f"已连接到数据库: {database_id}")
 
@@ -464,7 +614,20 @@ class NotionGameListV2:
             if data_sources:
                 self._data_source_id = data_sources[0].get("id")
 
-        # 检查属性是否为空
+        self._validate_schema(db_data)
+
+    def _validate_schema(self, db_data: tp.Optional[dict] = None):
+        """
+        校验已缓存的数据库属性架构
+        连接或创建数据库后调用一次；标题属性名等已在缓存属性时预先计算，
+        之后添加游戏时不再检查架构
+
+        Args:
+            db_data: 数据库原始响应（仅调试模式下用于打印）
+
+        Raises:
+            NotionApiError: 数据库中没有标题类型的属性
+        """
         if not self._db_properties_cache:
             echo.r("警告：数据库属性为空！")
             echo.y("这可能是因为：")
@@ -472,25 +635,13 @@ class NotionGameListV2:
             echo.y("2. API 响应格式不同，请检查 Notion API 版本")
             echo.y("3. 数据库权限不足")
             # 尝试打印完整的响应以便调试
-            debug_mode = os.getenv("DEBUG", "false").lower() in (
-                "true",
-                "1",
-                "yes",
-                "on",
-            )
-            if debug_mode:
+            if self.debug and db_data is not None:
                 echo.c(f"数据库响应: {db_data}")
         else:
             echo.c(f"数据库属性: {', '.join(self._db_properties_cache.keys())}")
 
         # 验证是否有标题属性
-        title_prop_name = None
-        for prop_name, prop_data in self._db_properties_cache.items():
-            if prop_data.get("type") == "title":
-                title_prop_name = prop_name
-                break
-
-        if not title_prop_name:
+        if not self._title_prop_name:
             echo.r("错误：数据库中未找到标题类型的属性！")
             echo.y("Notion 数据库必须包含至少一个标题类型的属性才能添加页面。")
             echo.y(
@@ -500,9 +651,22 @@ class NotionGameListV2:
                 message="数据库中未找到标题属性，无法添加游戏。请先在 Notion 中为数据库添加一个标题类型的属性。"
             )
 
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """
+        规范化游戏名称（去除首尾空白并忽略大小写），用于去重比较
+
+        Args:
+            name: 游戏名称
+
+        Returns:
+            str: 规范化后的名称
+        """
+        return name.strip().casefold()
+
     def get_existing_game_names(self) -> tp.Set[str]:
         """
-        获取数据库中已有的游戏名称集合（用于去重）
+        获取数据库中已有的游戏名称集合（用于去重，名称已规范化）
 
         Returns:
             Set[str]: 已有游戏名称的集合
@@ -515,21 +679,38 @@ class NotionGameListV2:
         获取数据库中已有的游戏名称到页面ID的映射（用于更新模式）
 
         Returns:
-            Dict[str, str]: 游戏名称到页面ID的映射
+            Dict[str, str]: 规范化游戏名称到页面ID的映射
         """
         if not self._database_id:
             raise NotionApiError(message="数据库ID未设置，请先创建或连接数据库")
 
+        # 新建的数据库肯定是空的，不需要查询
+        if self._is_new_database:
+            return {}
+
+        # 短时间内重复调用时直接使用缓存
+        cache_key = self._database_id
+        if (
+            self._existing_map_cache is not None
+            and self._existing_map_cache_key == cache_key
+            and time.monotonic() - self._existing_map_cache_time
+            < self.EXISTING_CACHE_TTL
+        ):
+            return dict(self._existing_map_cache)
+
         # 获取数据库属性以找到标题属性名称
         db_properties = self._ensure_db_properties_cache()
 
-        # 找到标题属性的实际名称
-        title_prop_name = self._get_title_property_name(db_properties)
+        # 标题属性的实际名称（设置属性缓存时已计算）
+        title_prop_name = self._title_prop_name
         if not title_prop_name:
             raise NotionApiError(message="数据库中未找到标题属性")
 
+        # 只请求标题属性，减小响应体积
+        title_prop_id = db_properties[title_prop_name].get("id")
+        query_params = {"filter_properties": [title_prop_id]} if title_prop_id else None
+
         existing_map = {}
-        next_cursor = None
 
         # 分页查询所有页面
         # 在 2025-09-03 API 版本中，如果数据库使用 data_sources，需要使用 data_source_id 查询
@@ -541,39 +722,60 @@ class NotionGameListV2:
             # 使用旧API版本：通过 database_id 查询
             query_endpoint = f"/databases/{self._database_id}/query"
 
-        while True:
-            query_payload = {"page_size": 100}  # Notion API 最大页面大小
-            if next_cursor:
-                query_payload["start_cursor"] = next_cursor
+        def _query_page(
+            cursor: tp.Optional[str],
+        ) -> tp.Tuple[tp.List[tp.Tuple[str, str]], tp.Optional[str]]:
+            """查询一页，只返回 (规范化名称, 页面ID) 列表和下一页游标，原始响应随即丢弃"""
+            query_payload = {
+                "page_size": 100,  # Notion API 最大页面大小
+                # 跳过没有标题的页面
+                "filter": {
+                    "property": title_prop_name,
+                    "title": {"is_not_empty": True},
+                },
+            }
+            if cursor:
+                query_payload["start_cursor"] = cursor
 
-            response = self._make_request("POST", query_endpoint, json=query_payload)
-            data = response.json()
+            response = self._make_request(
+                "POST", query_endpoint, params=query_params, json=query_payload
+            )
+            data = json_loads(response.content)
 
             # 提取游戏名称和页面ID
+            entries = []
             for page in data.get("results", []):
                 page_id = page.get("id")
-                properties = page.get("properties", {})
-                title_prop = properties.get(title_prop_name, {})
-                title_array = title_prop.get("title", [])
+                title_array = (
+                    page.get("properties", {}).get(title_prop_name, {}).get("title", [])
+                )
                 if title_array and page_id:
                     game_name = (
                         title_array[0].get("text", {}).get("content", "").strip()
                     )
                     if game_name:
-                        existing_map[game_name] = page_id
+                        entries.append((self._normalize_name(game_name), page_id))
+            return entries, data.get("next_cursor")
 
-            # 检查是否有更多页面
-            next_cursor = data.get("next_cursor")
+        # 逐页查询，直到没有下一页游标
+        next_cursor = None
+        while True:
+            entries, next_cursor = _query_page(next_cursor)
+            existing_map.update(entries)
             if not next_cursor:
                 break
 
-        return existing_map
+        self._existing_map_cache = existing_map
+        self._existing_map_cache_key = cache_key
+        self._existing_map_cache_time = time.monotonic()
+        return dict(existing_map)
 
     @staticmethod
     def _parse_date(game: GameInfo) -> tp.Optional[str]:
         """
         解析游戏发布日期字符串为日期字符串 (YYYY-MM-DD)
-        使用 dateparser 库支持多种语言和格式
+        常见英文格式直接用 strptime 解析，其他情况使用 dateparser 库（支持多种语言和格式）；
+        相同的日期字符串只解析一次
 
         Args:
             game: 游戏信息对象
@@ -587,98 +789,55 @@ class NotionGameListV2:
             return None
 
         try:
-            # dateparser 支持 200+ 种语言，自动识别语言和格式
-            parsed_date = dateparser.parse(
-                date_str,
-                languages=None,  # 自动检测语言（支持 200+ 种语言）
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",  # 如果只有年月，使用月初
-                    "PREFER_DATES_FROM": "past",  # 偏好过去的日期（适合游戏发布日期）
-                    "RELATIVE_BASE": datetime.now(),  # 相对日期的基准
-                },
-            )
-
-            if parsed_date:
-                return parsed_date.strftime("%Y-%m-%d")
-            else:
-                echo.r(
-                    f"游戏 '{game.name}:{game.id}' | 发布日期: '{date_str}' 无法解析"
-                )
-                return None
+            parsed_date = _parse_date_string(date_str)
         except Exception as e:
             echo.r(f"游戏 '{game.name}:{game.id}' | 解析日期 '{date_str}' 时出错: {e}")
             return None
 
+        if not parsed_date:
+            echo.r(f"游戏 '{game.name}:{game.id}' | 发布日期: '{date_str}' 无法解析")
+        return parsed_date
+
     def add_game(
         self,
         game: GameInfo,
         game_page: tp.Any = None,
         use_bg_as_cover: bool = False,
-        skip_if_exists: bool = False,
-        existing_names: tp.Optional[tp.Set[str]] = None,
     ) -> bool:
         """
-        向Notion游戏列表中添加一个游戏
+        向Notion游戏列表中添加一个游戏（总是创建新页面，去重由 import_game_list 负责）
 
         Args:
             game: 游戏信息对象
             game_page: 兼容参数（新API中不需要）
             use_bg_as_cover: 是否使用背景图片作为封面
-            skip_if_exists: 如果游戏已存在则跳过（不添加）
-            existing_names: 已有游戏名称集合（用于快速检查，如果为None则会在需要时查询）
 
         Returns:
-            bool: 是否添加成功（如果因为已存在而跳过，返回True）
+            bool: 是否添加成功
         """
         if not self._database_id:
             raise NotionApiError(message="数据库ID未设置，请先创建或连接数据库")
 
-        # 检查是否已存在
-        if skip_if_exists:
-            if existing_names is None:
-                existing_names = self.get_existing_game_names()
-            if game.name in existing_names:
-                return True  # 已存在，跳过但不视为错误
-
         try:
-            # 获取数据库属性（使用缓存或重新获取）
-            db_properties = self._ensure_db_properties_cache()
-
-            # 找到标题属性的实际名称
-            title_prop_name = self._get_title_property_name(db_properties)
-            if not title_prop_name:
-                # 如果属性缓存为空，尝试重新获取
-                if not db_properties:
-                    echo.y("数据库属性为空，尝试重新获取...")
-                    self._db_properties_cache = None
-                    db_properties = self._ensure_db_properties_cache()
-                    title_prop_name = self._get_title_property_name(db_properties)
-
-                if not title_prop_name:
-                    error_msg = "数据库中未找到标题属性"
-                    echo.r(f"错误：{error_msg}")
-                    echo.y(
-                        "提示：Notion 数据库必须包含至少一个标题类型的属性才能添加页面。"
-                    )
-                    raise NotionApiError(message=error_msg)
-
-            # 构建属性（包含标题）
-            properties = self._build_game_properties(
-                game, db_properties, include_title=True
+            # 确保数据库属性已缓存（标题属性名称在设置缓存时已计算）
+            self._ensure_db_properties_cache()
+            if not self._title_prop_name:
+                raise NotionApiError(message="数据库中未找到标题属性")
+
+            # 构建请求体（包含标题）
+            payload = {"parent": self._page_parent}
+            payload.update(
+                self._build_page_payload(game, use_bg_as_cover, include_title=True)
             )
 
-            # 构建请求体
-            payload = {
-                "parent": {"database_id": self._database_id},
-                "properties": properties,
-            }
-
-            # 添加图标和封面
-            payload.update(self._build_cover_payload(game, use_bg_as_cover))
-
             # 创建页面
             response = self._make_request("POST", "/pages", json=payload)
-            # page_data = response.json()
+
+            # 同步更新已有游戏缓存，避免缓存有效期内重复导入
+            if self._existing_map_cache is not None:
+                self._existing_map_cache[self._normalize_name(game.name)] = json_loads(
+                    response.content
+                ).get("id")
 
             return True
 
@@ -707,30 +866,20 @@ class NotionGameListV2:
             raise NotionApiError(message="数据库ID未设置，请先创建或连接数据库")
 
         try:
-            # 获取数据库属性（使用缓存或重新获取）
-            db_properties = self._ensure_db_properties_cache()
+            # 确保数据库属性已缓存
+            self._ensure_db_properties_cache()
 
-            # 构建属性（不包含标题）
-            properties = self._build_game_properties(
-                game, db_properties, include_title=False
+            # 构建请求体（不包含标题）
+            payload = self._build_page_payload(
+                game, use_bg_as_cover, include_title=False
             )
 
-            # 构建请求体
-            payload = {}
-
-            # 如果有属性需要更新，添加到payload
-            if properties:
-                payload["properties"] = properties
-
-            # 添加图标和封面
-            payload.update(self._build_cover_payload(game, use_bg_as_cover))
-
             # 如果没有需要更新的内容，直接返回成功
             if not payload:
                 return True
 
             # 更新页面
-            response = self._make_request("PATCH", f"/pages/{page_id}", json=payload)
+            self._make_request("PATCH", f"/pages/{page_id}", json=payload)
 
             return True
 
@@ -738,12 +887,39 @@ class NotionGameListV2:
             echo.r(f"更新游戏 '{game.name}' 失败: {e}")
             return False
 
+    def _import_batch(
+        self,
+        executor: ThreadPoolExecutor,
+        batch: tp.List[GameInfo],
+        game_page: tp.Any,
+        **kwargs,
+    ) -> tp.Dict[Future, tp.Tuple[GameInfo, bool]]:
+        """
+        提交一批新游戏的创建请求
+        Notion 目前没有批量创建页面的接口，每个游戏仍单独 POST /pages 并由线程池并发发送；
+        批量协议只需在此处切换，调用方无需改动
+
+        Args:
+            executor: 导入使用的线程池
+            batch: 本批要添加的游戏
+            game_page: 兼容参数（新API中不需要）
+            **kwargs: 其他参数（如use_bg_as_cover）
+
+        Returns:
+            Dict[Future, Tuple[GameInfo, bool]]: 任务到 (游戏, 是否为更新) 的映射
+        """
+        return {
+            executor.submit(self.add_game, game, game_page, **kwargs): (game, False)
+            for game in batch
+        }
+
     def import_game_list(
         self,
         game_list: tp.List[GameInfo],
         game_page: tp.Any = None,
         skip_duplicates: bool = True,
         update_mode: bool = False,
+        max_workers: int = DEFAULT_IMPORT_WORKERS,
         **kwargs,
     ) -> tp.List[GameInfo]:
         """
@@ -754,11 +930,21 @@ class NotionGameListV2:
             game_page: 兼容参数（新API中不需要）
             skip_duplicates: 是否跳过已存在的游戏（默认True，与update_mode互斥）
             update_mode: 是否更新已存在的游戏（默认False，与skip_duplicates互斥）
+            max_workers: 并发请求数（默认与 Notion 约 3 次/秒的限制一致）
             **kwargs: 其他参数（如use_bg_as_cover）
 
         Returns:
             List[GameInfo]: 导入失败的游戏列表
         """
+        if not self._database_id:
+            raise NotionApiError(message="数据库ID未设置，请先创建或连接数据库")
+
+        # 导入前一次性检查数据库属性，之后各线程只读共享状态
+        self._ensure_db_properties_cache()
+        if not self._title_prop_name:
+            echo.y("提示：Notion 数据库必须包含至少一个标题类型的属性才能添加页面。")
+            raise NotionApiError(message="数据库中未找到标题属性")
+
         errors = []
         skipped = []
         updated = []
@@ -812,54 +998,70 @@ class NotionGameListV2:
         imported_count = 0
         skipped_count = 0
         updated_count = 0
+        done = 0
+
+        # 有限并发提交请求，速率由 _make_request 中的限速器统一控制
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {}
+            to_add = []
+            for game in game_list:
+                name_key = self._normalize_name(game.name)
+                # 更新模式：如果游戏已存在，更新它
+                if update_mode and existing_map and name_key in existing_map:
+                    page_id = existing_map[name_key]
+                    future = executor.submit(self.update_game, game, page_id, **kwargs)
+                    futures[future] = (game, True)
+                    continue
 
-        for i, game in enumerate(game_list, start=1):
-            # 更新模式：如果游戏已存在，更新它
-            if update_mode and existing_map and game.name in existing_map:
-                page_id = existing_map[game.name]
-                if self.update_game(game, page_id, **kwargs):
+                # 检查是否已存在（跳过模式）
+                if skip_duplicates and existing_names and name_key in existing_names:
+                    skipped_count += 1
+                    done += 1
+                    skipped.append(game)
+                    continue
+
+                # 新游戏按批提交
+                to_add.append(game)
+                if len(to_add) >= self.IMPORT_BATCH_SIZE:
+                    futures.update(
+                        self._import_batch(
+                            executor,
+                            to_add,
+                            game_page,
+                            **kwargs,
+                        )
+                    )
+                    to_add = []
+            if to_add:
+                futures.update(
+                    self._import_batch(
+                        executor,
+                        to_add,
+                        game_page,
+                        **kwargs,
+                    )
+                )
+
+            # 进度行限频刷新（最后一个结果总是输出），避免每个游戏都写一次终端
+            last_progress = 0.0
+            for future in as_completed(futures):
+                game, is_update = futures[future]
+                done += 1
+                if not future.result():
+                    errors.append(game)
+                elif is_update:
                     updated_count += 1
                     updated.append(game)
+                else:
+                    imported_count += 1
+
+                now = time.monotonic()
+                if done == total or now - last_progress >= self.PROGRESS_INTERVAL:
+                    last_progress = now
                     echo.c(
-                        f"进度: {i}/{total} (已导入: {imported_count}, 已更新: {updated_count}, 已跳过: {skipped_count})",
+                        f"进度: {done}/{total} (已导入: {imported_count}, 已更新: {updated_count}, 已跳过: {skipped_count})",
                         end="\r",
                     )
-                else:
-                    errors.append(game)
-                # 添加延迟以避免速率限制
-                if i < total:
-                    time.sleep(0.15)
-                continue
-
-            # 检查是否已存在（跳过模式）
-            if skip_duplicates and existing_names and game.name in existing_names:
-                skipped_count += 1
-                skipped.append(game)
-                echo.c(
-                    f"进度: {i}/{total} (已导入: {imported_count}, 已跳过: {skipped_count})",
-                    end="\r",
-                )
-                continue
-
-            # 添加新游戏
-            if self.add_game(
-                game,
-                game_page,
-                skip_if_exists=skip_duplicates,
-                existing_names=existing_names,
-                **kwargs,
-            ):
-                imported_count += 1
-                echo.c(
-                    f"进度: {i}/{total} (已导入: {imported_count}, 已更新: {updated_count}, 已跳过: {skipped_count})",
-                    end="\r",
-                )
-            else:
-                errors.append(game)
-
-            # 添加延迟以避免速率限制
-            if i < total:
-                time.sleep(0.3)
 
         echo.m("")  # 换行
         if skipped_count > 0:
@@ -870,9 +1072,11 @@ class NotionGameListV2:
         return errors
 
     @staticmethod
+    @functools.cache
     def _game_list_schema():
         """
         获取游戏列表数据库的属性架构定义（中文）
+        架构固定不变，只构建一次（返回的字典为共享对象，不要修改）
 
         Returns:
             dict: 数据库属性架构字典
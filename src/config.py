@@ -0,0 +1,116 @@
+"""
+配置模块
+从环境变量（.env 文件）一次性读取运行配置
+"""
+
+import os
+import typing as tp
+from dataclasses import dataclass
+
+from src.utils import parse_bool_env
+
+# 默认值
+DEFAULT_NOTION_RPS = 2.7  # 略低于 Notion 约 3 次/秒的平均限制
+DEFAULT_FETCH_CONCURRENCY = 4  # 商店请求另由共享限速器控制在约 200 次/5 分钟以内
+
+# 必需的配置项：(环境变量名, Config 属性名)
+REQUIRED_FIELDS = (
+    ("NOTION_TOKEN", "notion_token"),
+    ("STEAM_TOKEN", "steam_token"),
+    ("STEAM_USER", "steam_user"),
+)
+
+
+def _parse_int(value: tp.Optional[str], default: tp.Optional[int]) -> tp.Optional[int]:
+    """解析整数类型环境变量，解析失败时返回默认值"""
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+def _parse_positive_int(value: tp.Optional[str]) -> tp.Optional[int]:
+    """解析正整数类型环境变量，未设置、解析失败或不大于 0 时返回 None"""
+    number = _parse_int(value, None)
+    return number if number is not None and number > 0 else None
+
+
+def _parse_float(value: tp.Optional[str], default: float) -> float:
+    """解析浮点类型环境变量，解析失败时返回默认值"""
+    try:
+        return float(value) if value else default
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    运行配置
+    所有配置项在启动时从环境变量读取一次，之后作为唯一来源传递给各客户端
+    """
+
+    # Notion 配置
+    notion_token: tp.Optional[str] = None
+    notion_page_id: tp.Optional[str] = None
+    notion_database_id: tp.Optional[str] = None  # 可选：已有数据库ID
+    notion_rps: float = DEFAULT_NOTION_RPS  # Notion 每秒最大请求数
+
+    # Steam 配置
+    steam_token: tp.Optional[str] = None
+    steam_user: tp.Optional[str] = None
+
+    # 导入选项
+    store_bg_cover: bool = False
+    skip_non_steam: bool = False
+    use_only_library: bool = False
+    skip_free_steam: bool = False
+    update_mode: bool = False
+
+    # 测试限制（None表示不限制）
+    test_limit: tp.Optional[int] = None
+    # Steam商店信息并发获取线程数
+    fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY
+
+    # 调试模式
+    debug: bool = False
+
+    def missing_required(self) -> tp.List[str]:
+        """
+        获取未配置的必需配置项
+
+        Returns:
+            List[str]: 缺失的环境变量名列表
+        """
+        return [name for name, attr in REQUIRED_FIELDS if not getattr(self, attr)]
+
+    @classmethod
+    def from_env(cls, environ: tp.Optional[tp.Mapping[str, str]] = None) -> "Config":
+        """
+        从环境变量构建配置
+
+        Args:
+            environ: 环境变量映射（可选，默认使用 os.environ）
+
+        Returns:
+            Config: 配置对象
+        """
+        env = dict(os.environ if environ is None else environ)
+        return cls(
+            notion_token=env.get("NOTION_TOKEN"),
+            notion_page_id=env.get("NOTION_PAGE_ID"),
+            notion_database_id=env.get("NOTION_DATABASE_ID"),
+            notion_rps=_parse_float(env.get("NOTION_RPS"), DEFAULT_NOTION_RPS),
+            steam_token=env.get("STEAM_TOKEN"),
+            steam_user=env.get("STEAM_USER"),
+            store_bg_cover=parse_bool_env(env.get("STORE_BG_COVER", "false")),
+            skip_non_steam=parse_bool_env(env.get("SKIP_NON_STEAM", "false")),
+            use_only_library=parse_bool_env(env.get("USE_ONLY_LIBRARY", "false")),
+            skip_free_steam=parse_bool_env(env.get("SKIP_FREE_STEAM", "false")),
+            update_mode=parse_bool_env(env.get("UPDATE_MODE", "false")),
+            test_limit=_parse_positive_int(env.get("TEST_LIMIT")),
+            fetch_concurrency=max(
+                1, _parse_int(env.get("FETCH_CONCURRENCY"), DEFAULT_FETCH_CONCURRENCY)
+            ),
+            debug=parse_bool_env(env.get("DEBUG", "false")),
+        )
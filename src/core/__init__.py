@@ -1,8 +1,77 @@
 """
 核心工具模块
-提供URL验证等核心功能
+提供URL验证、HTTP会话构建等核心功能
 """
+
+import typing as tp
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# 默认 User-Agent
+USER_AGENT = "steam-to-notion"
+# 传输层自动重试的状态码与HTTP方法
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# 只有幂等方法才在 5xx/读取错误时重试：POST（如创建 Notion 页面）在服务端已提交后
+# 重试会产生重复数据
+RETRY_METHODS = frozenset(["GET", "PATCH", "PUT", "DELETE"])
+# 被限流的请求服务端不会处理，任何方法都可以安全重试
+RATE_LIMIT_STATUS = 429
+
+
+class IdempotentRetry(Retry):
+    """
+    仅对幂等方法做状态码/读取错误重试的 Retry
+    非幂等方法（POST）只在 429 限流时重试；连接错误（请求未发出）的重试不受方法限制
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code == RATE_LIMIT_STATUS and self.total:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def create_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 32,
+    max_retries: int = 5,
+    backoff_factor: float = 1.5,
+) -> requests.Session:
+    """
+    创建共享的HTTP会话
+    Notion 与 Steam 客户端共用该会话，复用连接池以避免每次请求重新握手；
+    传输层对 429/5xx 按指数退避自动重试，并遵守 Retry-After 响应头；
+    5xx 只重试幂等方法，POST 仅在 429 时重试，避免重复创建页面
+
+    Args:
+        pool_connections: 连接池数量（按主机缓存）
+        pool_maxsize: 每个连接池的最大连接数
+        max_retries: 传输层最大重试次数
+        backoff_factor: 指数退避系数（秒）
+
+    Returns:
+        requests.Session: 配置好的会话对象
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=IdempotentRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def is_valid_link(url, verify_ssl=True):
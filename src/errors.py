@@ -3,7 +3,7 @@
 定义项目中的自定义异常类
 """
 
-from .utils import color
+from .utils import CLEAR_LINE, color
 
 
 class ServiceError(Exception):
@@ -53,14 +53,7 @@ class ServiceError(Exception):
 
     def __str__(self):
         """返回格式化的错误消息"""
-        import shutil
-
-        width = (
-            shutil.get_terminal_size().columns
-            if hasattr(shutil, "get_terminal_size")
-            else 80
-        )
-        msg = " " * width + "\r" + color.r(self.__class__.__name__)
+        msg = CLEAR_LINE + color.r(self.__class__.__name__)
 
         if self.message:
             msg += color.r(f": {self.message}")
@@ -8,6 +8,8 @@ import logging
 import os
 import re
 import typing as tp
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -20,7 +22,16 @@ from src.errors import (
     DataParseError,
 )
 from src.models.steam import SteamStoreApp
-from src.utils import color, echo, retry, dump_to_file, load_from_file
+from src.utils import (
+    CLEAR_LINE,
+    color,
+    echo,
+    json_loads,
+    retry,
+    RateLimiter,
+    dump_to_file,
+    load_from_file,
+)
 
 from .base import GameInfo, GamesLibrary, TGameID
 
@@ -33,6 +44,9 @@ TSteamApiKey = str  # Steam API密钥类型
 
 PLATFORM = "steam"  # 平台标识符
 
+# Steam自定义URL前缀（用于从个人资料链接中提取用户ID）
+STEAM_ID_URL_RE = re.compile(r"^https?://steamcommunity\.com/id/")
+
 
 class SteamStoreApi:
     """
@@ -42,30 +56,45 @@ class SteamStoreApi:
 
     # Steam商店API端点
     API_HOST = "https://store.steampowered.com/api/appdetails?appids={}"
-
-    def __init__(self):
+    # 商店接口约 200 次/5 分钟的限制：所有线程共用的平均速率，突发数为整个窗口，
+    # 只有连续请求超过 200 次后才会被限速
+    REQUESTS_PER_SECOND = 200 / 300
+    RATE_LIMIT_BURST = 200
+    # 被限速（429）后所有线程暂停的秒数（商店接口通常不返回 Retry-After）
+    RATE_LIMIT_PAUSE = 90
+
+    def __init__(self, session: tp.Optional[requests.Session] = None):
         """
         初始化Steam商店API客户端
+
+        Args:
+            session: 共享的HTTP会话（可选，未提供时自行创建）
         """
-        self.session = requests.Session()  # HTTP会话对象
+        self._owns_session = session is None  # 是否由本对象负责关闭会话
+        self.session = session if session is not None else requests.Session()
         self._cache = {}  # 游戏信息缓存
+        # 并发获取时所有线程共用同一个限速器
+        self._rate_limiter = RateLimiter(
+            self.REQUESTS_PER_SECOND, capacity=self.RATE_LIMIT_BURST
+        )
 
     def __enter__(self):
         """支持上下文管理器"""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """退出时关闭session"""
-        self.session.close()
+        """退出时关闭自行创建的session"""
+        if self._owns_session:
+            self.session.close()
 
     @retry(
         SteamStoreApiError,
         retry_num=2,
-        initial_wait=90,
+        initial_wait=0,  # 429 后的等待由共享限速器的暂停负责，这里不再重复等待
         backoff=1,
         raise_on_error=False,
         debug_msg="Steam商店API请求限制已超出",
-        debug=True,
+        debug=False,  # 多线程并发时不在同一行输出倒计时
     )
     def get_game_info(self, game_id: TGameID) -> tp.Optional[SteamStoreApp]:
         """
@@ -90,7 +119,15 @@ class SteamStoreApi:
 
         try:
             # 请求Steam商店API
+            self._rate_limiter.acquire()
             r = self.session.get(self.API_HOST.format(game_id), timeout=3)
+            if r.status_code == 429:
+                # 传输层重试后仍被限速：暂停限速器，让其他线程一起等待
+                try:
+                    pause = int(r.headers.get("Retry-After", self.RATE_LIMIT_PAUSE))
+                except ValueError:
+                    pause = self.RATE_LIMIT_PAUSE
+                self._rate_limiter.pause(pause)
             if not r.ok:
                 logger.error(f"Steam Store API 返回错误状态码: {r.status_code}")
                 raise SteamStoreApiError(
@@ -101,7 +138,7 @@ class SteamStoreApi:
 
             # JSON 解析错误
             try:
-                response_data = r.json()
+                response_data = json_loads(r.content)
                 response_body = response_data.get(str(game_id))
             except json.JSONDecodeError as e:
                 logger.error(f"Steam Store API 响应JSON解析失败: {e}")
@@ -179,16 +216,22 @@ class SteamGamesLibrary(GamesLibrary):
     # 游戏信息缓存文件名
     CACHE_GAME_FILE = "game_info_cache.json"
 
-    def __init__(self, api_key: TSteamApiKey, user_id: TSteamUserID):
+    def __init__(
+        self,
+        api_key: TSteamApiKey,
+        user_id: TSteamUserID,
+        session: tp.Optional[requests.Session] = None,
+    ):
         """
         初始化Steam游戏库
 
         Args:
             api_key: Steam API密钥
             user_id: Steam用户ID
+            session: 共享的HTTP会话（可选）
         """
         self.api = self._get_api(api_key)  # Steam API连接对象
-        self.store = SteamStoreApi()  # Steam商店API客户端
+        self.store = SteamStoreApi(session=session)  # Steam商店API客户端
         self.user = self._get_user(user_id)  # Steam用户对象
         self._games = {}  # 游戏信息字典
         self._store_skipped = []  # 从商店跳过的游戏ID列表
@@ -262,6 +305,7 @@ class SteamGamesLibrary(GamesLibrary):
         cls,
         api_key: tp.Optional[TSteamApiKey] = None,
         user_id: tp.Optional[TSteamUserID] = None,
+        session: tp.Optional[requests.Session] = None,
     ):
         """
         登录Steam（类方法）
@@ -270,6 +314,7 @@ class SteamGamesLibrary(GamesLibrary):
         Args:
             api_key: Steam API密钥（可选），如果为None则从环境变量 STEAM_TOKEN 读取
             user_id: Steam用户ID（可选），如果为None则从环境变量 STEAM_USER 读取
+            session: 共享的HTTP会话（可选）
 
         Returns:
             SteamGamesLibrary实例
@@ -286,28 +331,32 @@ class SteamGamesLibrary(GamesLibrary):
 
         # 从环境变量读取 user_id
         if user_id is None:
-            user_id_str = os.getenv("STEAM_USER")
-            if user_id_str:
-                # 处理环境变量中的 user_id（支持数字ID或自定义URL）
-                user_id_str = user_id_str.strip()
-                # 如果是纯数字，转换为整数（Steam 64位ID）
-                if user_id_str.isdigit():
-                    user_id = int(user_id_str)
-                else:
-                    # 否则作为自定义URL处理（移除URL前缀）
-                    user_id = re.sub(
-                        r"^https?:\/\/steamcommunity\.com\/id\/", "", user_id_str
-                    )
-            else:
+            user_id = os.getenv("STEAM_USER")
+            if not user_id:
                 # 如果环境变量也没有，提示用户输入
                 echo.y("请输入Steam用户个人资料ID。")
-                user_id = input(
-                    color.c("User: http://steamcommunity.com/profiles/")
-                ).strip()
-                # 移除URL前缀，只保留用户ID
-                user_id = re.sub(r"^https?:\/\/steamcommunity\.com\/id\/", "", user_id)
+                user_id = input(color.c("User: http://steamcommunity.com/profiles/"))
 
-        return cls(api_key=api_key, user_id=user_id)
+        if isinstance(user_id, str):
+            user_id = cls._parse_user_id(user_id)
+
+        return cls(api_key=api_key, user_id=user_id, session=session)
+
+    @staticmethod
+    def _parse_user_id(user_id: str) -> TSteamUserID:
+        """
+        解析字符串形式的Steam用户ID
+
+        Args:
+            user_id: 数字ID、自定义ID或个人资料URL
+
+        Returns:
+            TSteamUserID: 纯数字时返回整数（Steam 64位ID），否则返回移除URL前缀后的自定义ID
+        """
+        user_id = user_id.strip()
+        if user_id.isdigit():
+            return int(user_id)
+        return STEAM_ID_URL_RE.sub("", user_id)
 
     def _image_link(self, game_id: TGameID, img_hash: str):
         """
@@ -371,6 +420,7 @@ class SteamGamesLibrary(GamesLibrary):
         library_only: bool = False,
         force: bool = False,
         limit: tp.Optional[int] = None,
+        max_workers: int = 1,
     ):
         """
         从Steam游戏库获取游戏信息
@@ -381,6 +431,7 @@ class SteamGamesLibrary(GamesLibrary):
             library_only: 是否仅从游戏库获取信息（不使用商店API）
             force: 是否强制重新获取
             limit: 限制获取的游戏数量（用于测试，None表示不限制）
+            max_workers: 并发请求Steam商店的线程数（1表示串行）
 
         Raises:
             SteamApiError: API请求错误
@@ -396,6 +447,66 @@ class SteamGamesLibrary(GamesLibrary):
         if self._games and not force:
             return
 
+        def _fetch_store_game(game_id: str) -> tp.Optional[SteamStoreApp]:
+            try:
+                return self.store.get_game_info(game_id)
+            except SteamApiNotFoundError:
+                return None
+
+        def _add_game(g, game_id: str, steam_game: tp.Optional[SteamStoreApp]):
+            if not library_only:
+                if steam_game is None and skip_non_steam:
+                    echo.m(f"游戏 {g.name} id:{game_id} 在Steam商店中未找到，跳过")
+                    self._store_skipped.append(game_id)
+                    return
+
+                if steam_game is None:
+                    echo.r(
+                        f"游戏 {g.name} id:{game_id} 在Steam商店中未找到，从游戏库获取详细信息"
+                    )
+
+            logo_uri = None
+            if steam_game is not None and steam_game.header_image:
+                logo_uri = steam_game.header_image
+            elif getattr(g, "img_logo_url", None):
+                logo_uri = self._image_link(game_id, g.img_logo_url)
+
+            game_info = GameInfo(
+                id=game_id,
+                name=g.name,
+                platforms=[PLATFORM],
+                release_date=(
+                    steam_game.release_date.date
+                    if steam_game is not None and steam_game.release_date
+                    else None
+                ),
+                playtime=(
+                    self._playtime_format(g.playtime_forever)
+                    if getattr(g, "playtime_forever", None) is not None
+                    else None
+                ),
+                playtime_minutes=(
+                    g.playtime_forever
+                    if getattr(g, "playtime_forever", None) is not None
+                    else None
+                ),
+                logo_uri=logo_uri,
+                bg_uri=None,
+                icon_uri=(
+                    self._image_link(game_id, g.img_icon_url)
+                    if getattr(g, "img_icon_url", None) is not None
+                    else None
+                ),
+                free=steam_game.is_free if steam_game is not None else False,
+            )
+            # 没有打开跳过免费游戏选项，或者游戏不是免费的，缓存游戏信息
+            if not (skip_free_games and game_info.free):
+                self._cache_game(game_info)
+            # 打开跳过免费游戏选项后并且游戏是免费的，跳过
+            if skip_free_games and game_info.free:
+                return
+            self._games[game_id] = game_info
+
         @retry(
             SteamApiError,
             retry_num=3,
@@ -419,77 +530,49 @@ class SteamGamesLibrary(GamesLibrary):
                 )
                 return
 
-            for i, g in enumerate(sorted(games_iter, key=lambda x: x.name)):
+            pending = [
+                (i, g)
+                for i, g in enumerate(sorted(games_iter, key=lambda x: x.name))
+                if str(g.id) not in self._games
+            ]
+            workers = max(1, max_workers)
+
+            # 滑动窗口并发请求商店信息：最多 workers 个请求在途，每取走一个结果就补充
+            # 新请求；结果按原顺序处理。测试模式下在途请求数不超过 limit 的剩余数量
+            pending_iter = iter(pending)
+            window = deque()
+
+            def _fill_window(executor: ThreadPoolExecutor):
+                while len(window) < workers:
+                    if limit is not None and limit > 0:
+                        if len(self._games) + len(window) >= limit:
+                            return
+                    item = next(pending_iter, None)
+                    if item is None:
+                        return
+                    i, g = item
+                    game_id = str(g.id)
+                    future = (
+                        None
+                        if library_only
+                        else executor.submit(_fetch_store_game, game_id)
+                    )
+                    window.append((i, g, game_id, future))
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                _fill_window(executor)
+                while window:
+                    i, g, game_id, future = window.popleft()
+                    steam_game = future.result() if future is not None else None
+                    echo.c(
+                        f"{CLEAR_LINE}正在获取 [{i}/{number_of_games}]: {g.name}",
+                        end="\r",
+                    )
+                    _add_game(g, game_id, steam_game)
+                    _fill_window(executor)
+
                 if limit is not None and limit > 0 and len(self._games) >= limit:
                     echo.y(f"\n测试模式：已获取 {limit} 个游戏，停止获取")
-                    break
-
-                game_id = str(g.id)
-                if game_id in self._games:
-                    continue
-                echo.c(
-                    " " * 100 + f"\r正在获取 [{i}/{number_of_games}]: {g.name}",
-                    end="\r",
-                )
-
-                steam_game = None
-                if not library_only:
-                    try:
-                        steam_game = self.store.get_game_info(game_id)
-                    except SteamApiNotFoundError:
-                        pass
-
-                    if steam_game is None and skip_non_steam:
-                        echo.m(f"游戏 {g.name} id:{game_id} 在Steam商店中未找到，跳过")
-                        self._store_skipped.append(game_id)
-                        continue
-
-                    if steam_game is None:
-                        echo.r(
-                            f"游戏 {g.name} id:{game_id} 在Steam商店中未找到，从游戏库获取详细信息"
-                        )
-
-                logo_uri = None
-                if steam_game is not None and steam_game.header_image:
-                    logo_uri = steam_game.header_image
-                elif getattr(g, "img_logo_url", None):
-                    logo_uri = self._image_link(game_id, g.img_logo_url)
-
-                game_info = GameInfo(
-                    id=game_id,
-                    name=g.name,
-                    platforms=[PLATFORM],
-                    release_date=(
-                        steam_game.release_date.date
-                        if steam_game is not None and steam_game.release_date
-                        else None
-                    ),
-                    playtime=(
-                        self._playtime_format(g.playtime_forever)
-                        if getattr(g, "playtime_forever", None) is not None
-                        else None
-                    ),
-                    playtime_minutes=(
-                        g.playtime_forever
-                        if getattr(g, "playtime_forever", None) is not None
-                        else None
-                    ),
-                    logo_uri=logo_uri,
-                    bg_uri=None,
-                    icon_uri=(
-                        self._image_link(game_id, g.img_icon_url)
-                        if getattr(g, "img_icon_url", None) is not None
-                        else None
-                    ),
-                    free=steam_game.is_free if steam_game is not None else False,
-                )
-                # 没有打开跳过免费游戏选项，或者游戏不是免费的，缓存游戏信息
-                if not (skip_free_games and game_info.free):
-                    self._cache_game(game_info)
-                # 打开跳过免费游戏选项后并且游戏是免费的，跳过
-                if skip_free_games and game_info.free:
-                    continue
-                self._games[game_id] = game_info
 
         try:
             _fetch_games()
@@ -512,6 +595,18 @@ class SteamGamesLibrary(GamesLibrary):
         self._fetch_library_games(**kwargs)
         return list(self._games)
 
+    def iter_games(self, game_ids: tp.Iterable[TGameID]) -> tp.Iterator[GameInfo]:
+        """
+        按ID惰性迭代已获取的游戏信息（不构建中间列表）
+
+        Args:
+            game_ids: get_games_list 返回的游戏ID
+
+        Returns:
+            Iterator[GameInfo]: 游戏信息迭代器
+        """
+        return map(self._games.__getitem__, game_ids)
+
     def get_game_info(self, game_id: TGameID, **kwargs) -> GameInfo:
         """
         根据游戏ID获取游戏信息
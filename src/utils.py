@@ -7,13 +7,26 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
 from functools import wraps
 
 from termcolor import colored
 
+# 可选依赖：orjson 序列化/解析速度更快，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# 清除当前终端行并回到行首（ANSI 转义序列，Windows 下由 colorama 转换）
+CLEAR_LINE = "\x1b[2K\r"
+
+# 布尔类型环境变量的真值集合
+TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
 # Windows平台需要初始化colorama以支持颜色输出
 if sys.platform == "win32":
     import colorama
@@ -107,6 +120,57 @@ echo = Echo()  # 用于打印彩色消息
 color = ColorText()  # 用于返回彩色文本
 
 
+class RateLimiter:
+    """
+    令牌桶限速器
+    按固定速率补充令牌，允许少量突发；收到限流响应时可整体暂停（线程安全）
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        初始化限速器
+
+        Args:
+            rate: 每秒补充的令牌数（<=0 表示不限制）
+            capacity: 令牌桶容量（允许的最大突发请求数）
+        """
+        self.rate = rate if rate and rate > 0 else 0.0
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """获取一个令牌，令牌不足时阻塞等待"""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float):
+        """
+        暂停所有请求指定秒数（如服务端返回 Retry-After）
+
+        Args:
+            seconds: 暂停时长（秒）
+        """
+        if not self.rate:
+            time.sleep(seconds)
+            return
+        with self._lock:
+            # 同时重置补充起点，否则暂停前的空闲时间会在下次 acquire 时抵消暂停
+            self._last = time.monotonic()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
 def soft_exit(exit_code):
     """
     软退出函数
@@ -120,6 +184,44 @@ def soft_exit(exit_code):
     sys.exit(exit_code)
 
 
+def json_dumps(obj) -> bytes:
+    """
+    将对象序列化为 JSON 字节串（优先使用 orjson）
+
+    Args:
+        obj: 要序列化的对象
+
+    Returns:
+        bytes: UTF-8 编码的 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data):
+    """
+    解析 JSON 字节串或字符串（优先使用 orjson）
+
+    Args:
+        data: JSON 字节串或字符串
+
+    Returns:
+        解析后的对象
+
+    Raises:
+        json.JSONDecodeError: JSON 格式错误
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_bool_env(value: str) -> bool:
+    """解析布尔类型环境变量"""
+    return bool(value) and value.strip().lower() in TRUE_VALUES
+
+
 def load_from_file(filename):
     """
     从JSON文件加载数据
@@ -218,7 +320,7 @@ def retry(
                         echo.m("\n" + msg)
                         # 倒计时显示
                         for s in range(int(_delay), 1, -1):
-                            echo.m(" " * 20 + f"\r等待 {s} 秒...", end="\r")
+                            echo.m(f"{CLEAR_LINE}等待 {s} 秒...", end="\r")
                             time.sleep(1)
                     else:
                         time.sleep(_delay)